@@ -2,6 +2,7 @@
 Main entrypoint for the Claude Debugger application.
 """
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 
@@ -15,12 +16,25 @@ def setup_logging():
     log_dir = Path.home() / "AppData" / "Local" / "ClaudeDebugger"
     log_dir.mkdir(parents=True, exist_ok=True)
 
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+    # Buffer file records and write them in batches; errors flush immediately
+    # and logging.shutdown() flushes the rest at exit. The formatter goes on
+    # the FileHandler since MemoryHandler passes records through unformatted.
+    file_target = logging.FileHandler(log_dir / "app.log")
+    file_target.setFormatter(logging.Formatter(log_format))
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=512,
+        flushLevel=logging.ERROR,
+        target=file_target
+    )
+
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
-            logging.FileHandler(log_dir / "app.log"),
+            file_handler,
             logging.StreamHandler(sys.stdout)
         ]
     )
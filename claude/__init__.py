@@ -1,4 +1,4 @@
 """Claude client package."""
-from .client import ClaudeClient, ClaudeCLIError
+from .client import ClaudeClient, ClaudeCLIError, ClaudeCLITimeoutError
 
-__all__ = ["ClaudeClient", "ClaudeCLIError"]
\ No newline at end of file
+__all__ = ["ClaudeClient", "ClaudeCLIError", "ClaudeCLITimeoutError"]
\ No newline at end of file
@@ -2,10 +2,105 @@
 Claude CLI client wrapper for the debugger system.
 """
 import asyncio
+import os
+import shutil
+import signal
+import subprocess
+import sys
+from hashlib import blake2b
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Optional, Tuple, Union
 
-from core.cli_strings import check_sentinel_in_output
+from core.cli_strings import ARTIFACTS_DIR_NAME, CACHE_DIR_NAME, check_sentinel_in_output, sentinel_tail
+
+
+# Line buffer limit for streamed stdout; the asyncio default of 64KB is too
+# small for long single-line output from the CLI
+STREAM_LIMIT = 1 << 20
+
+# How long the CLI may stay silent after printing its sentinel before it is stopped
+SENTINEL_GRACE_SECONDS = 10
+
+# Don't allocate a console window for each CLI process on Windows; elsewhere
+# start the CLI in its own process group so it can be stopped with its children
+if sys.platform == "win32":
+    SPAWN_KWARGS = {"creationflags": subprocess.CREATE_NO_WINDOW}
+else:
+    SPAWN_KWARGS = {"start_new_session": True}
+
+# How long to wait for a stopped CLI to be reaped
+STOP_TIMEOUT_SECONDS = 5
+
+
+async def _signal_tree(proc: asyncio.subprocess.Process, kill: bool) -> bool:
+    """
+    Signal a CLI process and every process it started.
+
+    claude.cmd runs the node agent as a grandchild, so signalling only the
+    direct child would leave the agent running. Returns False if the tree
+    could not be signalled.
+    """
+    if sys.platform == "win32":
+        # Console processes ignore a soft close, so the tree is always forced
+        try:
+            killer = await asyncio.create_subprocess_exec(
+                "taskkill", "/T", "/F", "/PID", str(proc.pid),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+                **SPAWN_KWARGS
+            )
+            return await asyncio.wait_for(killer.wait(), STOP_TIMEOUT_SECONDS) == 0
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+    # The CLI leads its own process group (see SPAWN_KWARGS)
+    try:
+        os.killpg(proc.pid, signal.SIGKILL if kill else signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    except OSError:
+        return False
+    return True
+
+
+async def _stop_process(proc: asyncio.subprocess.Process, kill: bool = False) -> bool:
+    """
+    Stop a CLI process together with its children and wait for it to exit.
+
+    A terminated process that is still running after STOP_TIMEOUT_SECONDS
+    is killed.
+
+    Returns:
+        True if the process tree is confirmed stopped
+    """
+    signalled = True
+    if proc.returncode is None:
+        signalled = await _signal_tree(proc, kill)
+    try:
+        await asyncio.wait_for(proc.wait(), STOP_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        return False if kill else await _stop_process(proc, kill=True)
+
+    if sys.platform != "win32":
+        # Children that ignored SIGTERM outlive the group leader
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        except OSError:
+            return False
+    return signalled
+
+
+async def _feed_stdin(proc: asyncio.subprocess.Process, data: bytes):
+    """Write data to a process's stdin and close it; a CLI that exits early is not an error."""
+    try:
+        proc.stdin.write(data)
+        await proc.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+    finally:
+        proc.stdin.close()
 
 
 class ClaudeCLIError(Exception):
@@ -13,6 +108,19 @@ class ClaudeCLIError(Exception):
     pass
 
 
+class ClaudeCLITimeoutError(ClaudeCLIError):
+    """
+    Exception raised when a Claude CLI command exceeds its timeout.
+
+    Attributes:
+        stopped: True if the timed-out CLI and its children are confirmed stopped
+    """
+
+    def __init__(self, message: str, stopped: bool = False):
+        super().__init__(message)
+        self.stopped = stopped
+
+
 class ClaudeClient:
     """
     Client for executing Claude CLI commands with the dangerous flag.
@@ -21,7 +129,7 @@ class ClaudeClient:
     and executes commands in the specified working directory.
     """
 
-    def __init__(self, workdir: Path, exe: str = r"C:\Users\wow gaming\AppData\Roaming\npm\claude.cmd"):
+    def __init__(self, workdir: Union[str, Path], exe: str = r"C:\Users\wow gaming\AppData\Roaming\npm\claude.cmd"):
         """
         Initialize the Claude client.
 
@@ -29,16 +137,95 @@ class ClaudeClient:
             workdir: Working directory for command execution
             exe: Claude executable name/path
         """
-        self.workdir = Path(workdir)
+        self.workdir = workdir if isinstance(workdir, str) else os.fspath(workdir)
         self.exe = exe
 
-    async def run(self, prompt_text: str, timeout: int = 1800) -> str:
+        # Resolve the executable and build the command line once; every
+        # step of a task reuses them instead of repeating the PATH lookup.
+        self._cmd = [shutil.which(exe) or exe, "--dangerously-skip-permissions"]
+
+    def _tree_fingerprint(self) -> Optional[bytes]:
+        """
+        Return a fingerprint of the workdir's git state, or None if there is none.
+
+        It covers HEAD plus the size and mtime of every changed or untracked
+        file, so any edit to the tree (a failed run's included) changes it.
+        The task artifacts are left out; they change on every run.
+        """
+        def git(*args: str) -> bytes:
+            return subprocess.run(
+                ["git", *args], cwd=self.workdir, capture_output=True, check=True, **SPAWN_KWARGS
+            ).stdout
+
+        try:
+            top, head = git("rev-parse", "--show-toplevel", "HEAD").splitlines()
+            status = git("status", "--porcelain", "-z", "--untracked-files=all",
+                         "--", ".", f":(exclude){ARTIFACTS_DIR_NAME}")
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        # Status paths are relative to the top of the checkout
+        top = os.fsdecode(top)
+        parts = [head]
+        entries = iter(status.split(b"\0"))
+        for entry in entries:
+            if not entry:
+                continue
+            parts.append(entry)
+            try:
+                st = os.stat(os.path.join(top, os.fsdecode(entry[3:])))
+                parts.append(f"{st.st_size}:{st.st_mtime_ns}".encode())
+            except OSError:
+                parts.append(b"-")
+            if entry[:1] in b"RC":
+                # Renames and copies are followed by their source path
+                next(entries, None)
+        return b"\0".join(parts)
+
+    def _cache_path(self, prompt_text: str, fingerprint: bytes) -> str:
+        """Return the response cache file for a prompt against a given tree state."""
+        h = blake2b(digest_size=16)
+        h.update(self.workdir.encode("utf-8"))
+        h.update(b"\0")
+        h.update(fingerprint)
+        h.update(b"\0")
+        h.update(prompt_text.encode("utf-8"))
+        return os.path.join(self.workdir, ARTIFACTS_DIR_NAME, CACHE_DIR_NAME, f"{h.hexdigest()}.txt")
+
+    @staticmethod
+    def _cache_get(path: str) -> Optional[bytes]:
+        """Return a cached raw response, or None on a miss."""
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _cache_put(self, path: str, output: bytes):
+        """Store a raw response; written to a temp file and renamed into place."""
+        tmp = f"{path}.{os.getpid()}-{id(self)}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(output)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    async def run(self, prompt_text: str, timeout: int = 1800, cache: bool = False,
+                  decode: bool = True) -> Union[str, bytes]:
         """
         Execute a Claude CLI command.
 
         Args:
             prompt_text: The prompt to send to Claude
             timeout: Timeout in seconds (default 30 minutes)
+            cache: Reuse a stored response for an identical prompt while the
+                project tree is unchanged. Only enable for read-only prompts;
+                steps that edit files must always run. Has no effect outside
+                a git checkout, where the tree can't be fingerprinted.
+            decode: Return the output as text; pass False to get the raw
+                bytes, e.g. when they only go to a file
 
         Returns:
             The stdout output from Claude
@@ -46,24 +233,44 @@ class ClaudeClient:
         Raises:
             ClaudeCLIError: If the command fails
         """
-        cmd = [
-            r"C:\Users\wow gaming\AppData\Roaming\npm\claude.cmd",
-            "--dangerously-skip-permissions"
-        ]
+        cache_path = None
+        if cache:
+            fingerprint = await asyncio.to_thread(self._tree_fingerprint)
+            if fingerprint is not None:
+                cache_path = self._cache_path(prompt_text, fingerprint)
+
+        output = self._cache_get(cache_path) if cache_path else None
+        if output is None:
+            output = await self._run_cli(prompt_text, timeout)
+            if cache_path:
+                self._cache_put(cache_path, output)
+
+        return output.decode("utf-8", errors="ignore") if decode else output
+
+    async def _spawn(self, timeout: int) -> asyncio.subprocess.Process:
+        """Start the Claude CLI in the workdir with piped stdio."""
+        cmd = self._cmd
 
         print(f"executing claude command: {cmd}")
 
+        proc = await asyncio.wait_for(
+            asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.workdir,
+                stdin=asyncio.subprocess.PIPE,   # 👈 allow sending prompt via stdin
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=STREAM_LIMIT,
+                **SPAWN_KWARGS
+            ),
+            timeout=timeout
+        )
+        return proc
+
+    async def _run_cli(self, prompt_text: str, timeout: int) -> bytes:
+        """Spawn the Claude CLI, feed it the prompt and return its raw stdout."""
         try:
-            proc = await asyncio.wait_for(
-                asyncio.create_subprocess_exec(
-                    *cmd,
-                    cwd=str(self.workdir),
-                    stdin=asyncio.subprocess.PIPE,   # 👈 allow sending prompt via stdin
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                ),
-                timeout=timeout
-            )
+            proc = await self._spawn(timeout)
 
             # send the prompt and wait for output
             out, err = await proc.communicate(input=prompt_text.encode("utf-8"))
@@ -74,22 +281,30 @@ class ClaudeClient:
                     f"Claude CLI failed with exit code {proc.returncode}: {error_msg}"
                 )
 
-            return (out or b"").decode("utf-8", errors="ignore")
+            return out or b""
 
         except asyncio.TimeoutError:
-            raise ClaudeCLIError(f"Claude CLI command timed out after {timeout} seconds")
+            raise ClaudeCLITimeoutError(f"Claude CLI command timed out after {timeout} seconds")
         except Exception as e:
             raise ClaudeCLIError(f"Failed to execute Claude CLI: {str(e)}")
 
 
-    async def run_with_sentinel(self, prompt_text: str, sentinel: str, timeout: int = 1800) -> Tuple[str, bool]:
+    async def run_with_sentinel(self, prompt_text: str, sentinel: Union[str, Callable[[str], bool]],
+                                timeout: int = 1800, decode: bool = True) -> Tuple[Union[str, bytes], bool]:
         """
         Execute Claude CLI and check for a sentinel string.
 
+        Output is read line by line as it arrives. Once the sentinel is the
+        last line printed and the CLI stays silent for SENTINEL_GRACE_SECONDS,
+        the process is terminated instead of waiting for it to exit.
+
         Args:
             prompt_text: The prompt to send to Claude
-            sentinel: The sentinel string to check for
+            sentinel: The sentinel string to check for, or a checker such as
+                core.cli_strings.check_pass
             timeout: Timeout in seconds
+            decode: Return the output as text; pass False to get the raw
+                bytes. The sentinel check then only decodes the last lines.
 
         Returns:
             Tuple of (output, sentinel_found)
@@ -97,6 +312,76 @@ class ClaudeClient:
         Raises:
             ClaudeCLIError: If the command fails
         """
-        output = await self.run(prompt_text, timeout)
-        sentinel_found = check_sentinel_in_output(output, sentinel)
-        return output, sentinel_found
\ No newline at end of file
+        if callable(sentinel):
+            check = sentinel
+        else:
+            def check(output: str) -> bool:
+                return check_sentinel_in_output(output, sentinel)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        proc = None
+        stdin_task = None
+        stderr_task = None
+
+        try:
+            proc = await self._spawn(timeout)
+
+            # Feed stdin and drain stderr while stdout is read, so no pipe
+            # fills up and stalls the CLI while a large prompt is written
+            stderr_task = asyncio.create_task(proc.stderr.read())
+            stdin_task = asyncio.create_task(_feed_stdin(proc, prompt_text.encode("utf-8")))
+            out = bytearray()
+            armed = False
+            stopped = False
+
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                wait = min(remaining, SENTINEL_GRACE_SECONDS) if armed else remaining
+
+                try:
+                    line = await asyncio.wait_for(proc.stdout.readline(), wait)
+                except asyncio.TimeoutError:
+                    if not armed:
+                        raise
+                    # Sentinel printed and the CLI went quiet: don't wait for it to exit
+                    await _stop_process(proc)
+                    stopped = True
+                    break
+
+                if not line:
+                    break
+                out += line
+                if line.strip():
+                    armed = check(line.decode("utf-8", errors="ignore"))
+
+            if not stopped:
+                await stdin_task
+                await proc.wait()
+                err = await stderr_task
+                if proc.returncode != 0:
+                    raise ClaudeCLIError(
+                        f"Claude CLI failed with exit code {proc.returncode}: {err.decode(errors='ignore')}"
+                    )
+
+            if not decode:
+                output = bytes(out)
+                return output, check(sentinel_tail(output))
+            output = out.decode("utf-8", errors="ignore")
+            return output, check(output)
+
+        except ClaudeCLIError:
+            raise
+        except asyncio.TimeoutError:
+            stopped = proc is not None and await _stop_process(proc, kill=True)
+            raise ClaudeCLITimeoutError(f"Claude CLI command timed out after {timeout} seconds", stopped)
+        except Exception as e:
+            raise ClaudeCLIError(f"Failed to execute Claude CLI: {str(e)}")
+        finally:
+            if proc is not None and proc.returncode is None:
+                await _stop_process(proc, kill=True)
+            for pipe_task in (stdin_task, stderr_task):
+                if pipe_task is not None and not pipe_task.done():
+                    pipe_task.cancel()
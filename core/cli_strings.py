@@ -1,6 +1,7 @@
 """
 Canonical sentinel strings and CLI helpers for the Claude Debugger.
 """
+from typing import Callable
 
 # Sentinel strings for each step
 STEP2_SENTINEL = "RESULT: TESTS_WRITTEN"
@@ -13,6 +14,46 @@ CLI_COMMAND_TEMPLATE = "claude --dangerously-skip-permisstions \"{prompt}\""
 # Directory names
 TEST_DIR_NAME = "test_bugfix"
 ARTIFACTS_DIR_NAME = ".claude_tasks"
+CACHE_DIR_NAME = "_cache"
+
+# How many lines at the end of the output are searched for a sentinel
+SENTINEL_LINES = 3
+
+def _last_lines_match(output: str, target: str) -> bool:
+    """Return True if one of the last SENTINEL_LINES lines of output, upper-cased, equals target."""
+    # Walk back from the end with rfind so only the last lines are touched,
+    # however large the output is
+    end = len(output)
+    while end and output[end - 1].isspace():
+        end -= 1
+
+    for _ in range(SENTINEL_LINES):
+        if end <= 0:
+            break
+        start = output.rfind("\n", 0, end) + 1
+        if output[start:end].strip().upper() == target:
+            return True
+        end = start - 1
+    return False
+
+
+def sentinel_tail(output: bytes) -> str:
+    """
+    Decode just the end of raw output that the sentinel checks look at.
+
+    Whole lines are taken from the end until, with trailing whitespace
+    removed, they hold SENTINEL_LINES lines, so checking the tail gives the
+    same answer as checking the whole decoded output.
+    """
+    start = len(output)
+    while True:
+        # A newline byte never occurs inside a UTF-8 sequence, so every
+        # line start is a safe place to begin decoding
+        start = output.rfind(b"\n", 0, max(start - 1, 0)) + 1
+        tail = output[start:].decode("utf-8", errors="ignore")
+        if start == 0 or tail.rstrip().count("\n") >= SENTINEL_LINES - 1:
+            return tail
+
 
 def check_sentinel_in_output(output: str, sentinel: str) -> bool:
     """
@@ -25,10 +66,20 @@ def check_sentinel_in_output(output: str, sentinel: str) -> bool:
     Returns:
         True if sentinel is found in the last 3 lines
     """
-    lines = output.strip().splitlines()
-    last_lines = lines[-3:] if len(lines) >= 3 else lines
+    return _last_lines_match(output, sentinel.upper())
 
-    for line in last_lines:
-        if line.strip().upper() == sentinel.upper():
-            return True
-    return False
\ No newline at end of file
+
+def _make_checker(sentinel: str) -> Callable[[str], bool]:
+    """Build a check_sentinel_in_output specialised for one sentinel."""
+    target = sentinel.upper()
+
+    def check(output: str) -> bool:
+        return _last_lines_match(output, target)
+
+    return check
+
+
+# Pre-built checkers for the known sentinels
+check_step2 = _make_checker(STEP2_SENTINEL)
+check_pass = _make_checker(PASS_SENTINEL)
+check_fail = _make_checker(FAIL_SENTINEL)
@@ -3,37 +3,62 @@ Background task manager for the Claude Debugger system.
 """
 import asyncio
 import logging
-from pathlib import Path
-from queue import Queue
-from typing import Optional
+import os
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set, Union
 
-from claude import ClaudeClient, ClaudeCLIError
+from claude import ClaudeClient, ClaudeCLIError, ClaudeCLITimeoutError
 from core.models import TaskItem, TaskStatus, UiEvent, StepResult
 from core.prompts import step1_prompt, step2_prompt, step3_prompt
-from core.cli_strings import STEP2_SENTINEL, PASS_SENTINEL, FAIL_SENTINEL
+from core.cli_strings import (
+    FAIL_SENTINEL, TEST_DIR_NAME, ARTIFACTS_DIR_NAME, check_step2, check_pass
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Time budget for each fix/re-test attempt; step 3 runs all attempts in one
+# CLI call, so its timeout is this times max_attempts
+ATTEMPT_TIMEOUT_SECONDS = 1800
+
+
+def _write_report(path: str, data: Union[str, bytes]):
+    """Write a step report file; raw CLI bytes are written as-is."""
+    if isinstance(data, bytes):
+        with open(path, "wb") as f:
+            f.write(data)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
+
 
 class TaskManager:
     """
     Background task manager that processes debugging tasks through the three-stage pipeline.
     """
 
-    def __init__(self, ui_queue: Queue, max_attempts: int = 3):
+    def __init__(self, ui_queue: Deque[UiEvent], max_attempts: int = 3, max_concurrency: int = 4,
+                 ui_notify: Optional[Callable[[], None]] = None, max_queued: int = 64):
         """
         Initialize the task manager.
 
         Args:
-            ui_queue: Queue for sending UI events
+            ui_queue: Deque the UI thread drains for events
             max_attempts: Maximum attempts for Step 3 (fixing)
+            max_concurrency: Maximum number of tasks processed at the same time
+            ui_notify: Thread-safe callable that tells the UI thread events are waiting
+            max_queued: Maximum number of tasks waiting for a slot; add_task blocks past this
         """
         self.ui_queue = ui_queue
+        self.ui_notify = ui_notify
         self.max_attempts = max_attempts
-        self.task_queue: asyncio.Queue = asyncio.Queue()
+        self.task_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queued)
         self.running = False
         self._worker_task: Optional[asyncio.Task] = None
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._pending: Set[asyncio.Task] = set()
+        # One lock per resolved project root: pipelines in the same root share
+        # its test directory and working tree, so they must not overlap
+        self._root_locks: Dict[str, asyncio.Lock] = {}
 
     def start(self):
         """Start the background worker."""
@@ -51,149 +76,217 @@ class TaskManager:
             except asyncio.CancelledError:
                 pass
 
+        # Let in-flight tasks finish their current pipeline
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
     async def add_task(self, task: TaskItem):
         """Add a task to the processing queue."""
         await self.task_queue.put(task)
         self._emit_ui_event("enqueued", task.id, f"Task {task.id.hex[:8]} enqueued")
 
     def _emit_ui_event(self, kind: str, task_id, payload: str):
-        """Emit an event to the UI thread."""
-        try:
-            event = UiEvent(kind=kind, task_id=task_id, payload=payload)
-            self.ui_queue.put(event)
-        except Exception as e:
-            logger.error(f"Failed to emit UI event: {e}")
+        """
+        Emit an event to the UI thread.
+
+        The UiEvent dataclass itself is handed over; both threads share the
+        process, so nothing is serialized.
+        """
+        # deque.append is atomic, so no lock is taken per event
+        self.ui_queue.append(UiEvent(kind=kind, task_id=task_id, payload=payload))
+        if self.ui_notify:
+            self.ui_notify()
 
     async def _worker_loop(self):
-        """Main worker loop that processes tasks."""
-        while self.running:
+        """Main worker loop that processes tasks; runs until cancelled by stop()."""
+        while True:
             try:
-                # Wait for a task with timeout to allow checking running flag
-                task = await asyncio.wait_for(self.task_queue.get(), timeout=1.0)
-                await self._process_task(task)
-            except asyncio.TimeoutError:
-                continue
+                # Take a slot first so tasks stay queued while all slots are busy
+                await self._sem.acquire()
+                try:
+                    task = await self.task_queue.get()
+                except BaseException:
+                    self._sem.release()
+                    raise
+
+                runner = asyncio.create_task(self._run_bounded(task))
+                self._pending.add(runner)
+                runner.add_done_callback(self._pending.discard)
             except Exception as e:
                 logger.error(f"Error in worker loop: {e}")
 
-    async def _process_task(self, task: TaskItem):
+    async def _run_bounded(self, task: TaskItem):
+        """
+        Process a task and release its concurrency slot when done.
+
+        Tasks for the same project root run one after another; tasks for
+        different roots still run side by side, up to max_concurrency.
+        """
+        try:
+            # resolve() touches the filesystem and can stall on a network
+            # drive, so it runs in a worker thread; the root is resolved once
+            # here and passed on as a plain string
+            project_root = os.fspath(await asyncio.to_thread(task.project_root.resolve))
+        except BaseException as e:
+            self._sem.release()
+            if not isinstance(e, Exception):
+                raise
+            self._fail_task(task, e)
+            return
+
+        lock = self._root_locks.setdefault(project_root, asyncio.Lock())
+
+        if not lock.locked():
+            try:
+                async with lock:
+                    await self._process_task(task, project_root)
+            finally:
+                self._sem.release()
+            return
+
+        # Another pipeline is working in this root: give the slot back so
+        # other roots can use it, and take one again once the root is free
+        self._sem.release()
+        async with lock, self._sem:
+            await self._process_task(task, project_root)
+
+    def _fail_task(self, task: TaskItem, error: Exception):
+        """Mark a task as failed and report the error to the UI."""
+        task_id_short = task.id.hex[:8]
+        logger.error(f"Task {task_id_short} failed: {error}")
+        task.status = TaskStatus.FAILED
+        self._emit_ui_event("error", task.id, f"[{task_id_short}] ❌ failed: {str(error)}")
+
+    async def _process_task(self, task: TaskItem, project_root: str):
         """
         Process a single task through the three-stage pipeline.
 
         Args:
             task: The task to process
+            project_root: The task's resolved project root
         """
         task.status = TaskStatus.RUNNING
         task_id_short = task.id.hex[:8]
+        # Every UI line for this task starts with the same prefix; build it once
+        prefix = f"[{task_id_short}] "
 
         try:
-            self._emit_ui_event("status", task.id, f"[{task_id_short}] status → RUNNING")
+            self._emit_ui_event("status", task.id, prefix + "status → RUNNING")
 
             # Setup directories
-            project_root = task.project_root.resolve()
-            tests_dir = project_root / "test_bugfix"
-            artifacts_dir = project_root / ".claude_tasks" / f"item_{task.id.hex}"
-
-            # Create directories
-            tests_dir.mkdir(parents=True, exist_ok=True)
-            artifacts_dir.mkdir(parents=True, exist_ok=True)
+            tests_dir = os.path.join(project_root, TEST_DIR_NAME)
+            artifacts_dir = os.path.join(project_root, ARTIFACTS_DIR_NAME, f"item_{task.id.hex}")
 
             # Step files
-            step1_file = artifacts_dir / "step1.md"
-            step2_file = artifacts_dir / "step2.md"
-            step3_file = artifacts_dir / "step3.md"
+            step1_file = os.path.join(artifacts_dir, "step1.md")
+            step2_file = os.path.join(artifacts_dir, "step2.md")
+            step3_file = os.path.join(artifacts_dir, "step3.md")
 
             # Initialize Claude client
             client = ClaudeClient(project_root)
 
-
-            # Step 1: Scope and analyze
-            await self._execute_step1(client, task, step1_file, task_id_short)
+            # Step 1: Scope and analyze; the directories are created in a worker
+            # thread while the CLI starts up
+            make_dirs = asyncio.to_thread(self._make_dirs, tests_dir, artifacts_dir)
+            step1_output = await self._execute_step1(client, task, step1_file, prefix, make_dirs)
 
             # Step 2: Generate failing tests
-            await self._execute_step2(client, task, step1_file, tests_dir, step2_file, task_id_short)
+            step2_output = await self._execute_step2(client, task, step1_file, tests_dir, step2_file, prefix)
 
             # Step 3: Fix and run iteratively
-            await self._execute_step3(client, task, tests_dir, step3_file, step1_file, step2_file, task_id_short)
+            await self._execute_step3(client, task, tests_dir, step3_file, step1_output, step2_output, prefix)
 
         except Exception as e:
-            logger.error(f"Task {task_id_short} failed: {e}")
-            task.status = TaskStatus.FAILED
-            self._emit_ui_event("error", task.id, f"[{task_id_short}] ❌ failed: {str(e)}")
+            self._fail_task(task, e)
+
+    @staticmethod
+    def _make_dirs(*dirs: str):
+        """Create the task directories."""
+        for d in dirs:
+            os.makedirs(d, exist_ok=True)
+
+    async def _execute_step1(self, client: ClaudeClient, task: TaskItem, step1_file: str, prefix: str,
+                             make_dirs: Awaitable[None]) -> str:
+        """
+        Execute Step 1: Scope and analyze. Returns the analysis.
 
-    async def _execute_step1(self, client: ClaudeClient, task: TaskItem, step1_file: Path, task_id_short: str):
-        """Execute Step 1: Scope and analyze."""
-        self._emit_ui_event("step", task.id, f"[{task_id_short}] step 1: Analyzing scope...")
+        make_dirs runs alongside the CLI call and is awaited before
+        step1_file is written.
+        """
+        self._emit_ui_event("step", task.id, prefix + "step 1: Analyzing scope...")
 
-        prompt = step1_prompt(str(task.project_root), task.description)
-        output = await client.run(prompt)
+        prompt = step1_prompt(client.workdir, task.description)
+        # Step 1 only reads the project, so an identical prompt can reuse its answer
+        output, _ = await asyncio.gather(client.run(prompt, cache=True), make_dirs)
 
-        step1_file.write_text(output, encoding="utf-8")
-        self._emit_ui_event("step_complete", task.id, f"[{task_id_short}] step 1: ✅ analysis complete")
+        _write_report(step1_file, output)
+        self._emit_ui_event("step_complete", task.id, prefix + "step 1: ✅ analysis complete")
+        return output
 
-    async def _execute_step2(self, client: ClaudeClient, task: TaskItem, step1_file: Path,
-                           tests_dir: Path, step2_file: Path, task_id_short: str):
-        """Execute Step 2: Generate failing tests."""
-        self._emit_ui_event("step", task.id, f"[{task_id_short}] step 2: Generating failing tests...")
+    async def _execute_step2(self, client: ClaudeClient, task: TaskItem, step1_file: str,
+                           tests_dir: str, step2_file: str, prefix: str) -> str:
+        """Execute Step 2: Generate failing tests. Returns the test report."""
+        self._emit_ui_event("step", task.id, prefix + "step 2: Generating failing tests...")
 
-        prompt = step2_prompt(str(step1_file), str(tests_dir))
-        output, sentinel_found = await client.run_with_sentinel(prompt, STEP2_SENTINEL)
+        prompt = step2_prompt(step1_file, tests_dir)
+        output, sentinel_found = await client.run_with_sentinel(prompt, check_step2)
 
-        step2_file.write_text(output, encoding="utf-8")
+        _write_report(step2_file, output)
 
         if sentinel_found:
-            self._emit_ui_event("step_complete", task.id, f"[{task_id_short}] step 2: ✅ tests written")
+            self._emit_ui_event("step_complete", task.id, prefix + "step 2: ✅ tests written")
         else:
-            self._emit_ui_event("warning", task.id, f"[{task_id_short}] step 2: ⚠️ sentinel missing, continuing")
+            self._emit_ui_event("warning", task.id, prefix + "step 2: ⚠️ sentinel missing, continuing")
+        return output
 
-    async def _execute_step3(self, client: ClaudeClient, task: TaskItem, tests_dir: Path,
-                           step3_file: Path, step1_file: Path, step2_file: Path, task_id_short: str):
+    async def _execute_step3(self, client: ClaudeClient, task: TaskItem, tests_dir: str,
+                           step3_file: str, step1_output: str, step2_output: str, prefix: str):
         """Execute Step 3: Fix and run iteratively."""
-        self._emit_ui_event("step", task.id, f"[{task_id_short}] step 3: Fixing and running tests...")
-
-        attempt_logs = []
-        passed = False
-
-        for attempt in range(1, self.max_attempts + 1):
-            self._emit_ui_event("attempt", task.id, f"[{task_id_short}] step 3: attempt {attempt}/{self.max_attempts}")
+        self._emit_ui_event("step", task.id,
+                            prefix + f"step 3: Fixing and running tests (up to {self.max_attempts} attempts)...")
 
-            prompt = step3_prompt(str(tests_dir), str(step1_file), str(step2_file), attempt, self.max_attempts)
-            output, sentinel_found = await client.run_with_sentinel(prompt, PASS_SENTINEL)
+        # Claude iterates up to max_attempts within one run, so the run gets
+        # the time budget of all of them
+        prompt = step3_prompt(tests_dir, step1_output, step2_output, self.max_attempts)
+        timeout = ATTEMPT_TIMEOUT_SECONDS * self.max_attempts
 
-            attempt_logs.append(f"--- Attempt {attempt} ---\n{output}\n")
-
-            if sentinel_found:
-                passed = True
-                break
+        # The step 3 output only goes to step3.md, so keep it as raw bytes
+        try:
+            output, passed = await client.run_with_sentinel(prompt, check_pass, timeout=timeout, decode=False)
+        except ClaudeCLITimeoutError as e:
+            # Only a timeout is worth a second run; failures were already retried by Claude.
+            # A leftover agent would edit the same files, so only retry once it is gone
+            if not e.stopped:
+                raise
+            self._emit_ui_event("attempt", task.id, prefix + "step 3: ⚠️ timed out, retrying once")
+            output, passed = await client.run_with_sentinel(prompt, check_pass, timeout=timeout, decode=False)
 
-        # Write all attempts to step3.md
-        step3_file.write_text("".join(attempt_logs), encoding="utf-8")
+        _write_report(step3_file, output)
 
         if passed:
             task.status = TaskStatus.COMPLETED
-            self._emit_ui_event("completed", task.id, f"[{task_id_short}] ✅ done: RESULT: PASS")
+            self._emit_ui_event("completed", task.id, prefix + "✅ done: RESULT: PASS")
         else:
             task.status = TaskStatus.FAILED
-            self._emit_ui_event("failed", task.id, f"[{task_id_short}] ❌ failed: max attempts reached")
+            self._emit_ui_event("failed", task.id, prefix + "❌ failed: max attempts reached")
 
 
-async def run_manager_in_thread(ui_queue: Queue, manager_queue: asyncio.Queue):
+async def run_manager_in_thread(ui_queue: Deque[UiEvent], manager_queue: asyncio.Queue,
+                                ui_notify: Optional[Callable[[], None]] = None):
     """
     Run the task manager in a separate thread.
 
     Args:
-        ui_queue: Queue for UI events
+        ui_queue: Deque for UI events
         manager_queue: Queue for receiving tasks
+        ui_notify: Thread-safe callable that tells the UI thread events are waiting
     """
-    manager = TaskManager(ui_queue)
+    manager = TaskManager(ui_queue, ui_notify=ui_notify)
     manager.start()
 
     try:
         while True:
-            try:
-                task = await asyncio.wait_for(manager_queue.get(), timeout=1.0)
-                await manager.add_task(task)
-            except asyncio.TimeoutError:
-                continue
+            task = await manager_queue.get()
+            await manager.add_task(task)
     finally:
         await manager.stop()
\ No newline at end of file
@@ -2,6 +2,7 @@
 Core data models for the Claude Debugger system.
 """
 import uuid
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -37,18 +38,16 @@ class TaskItem(BaseModel):
         arbitrary_types_allowed = True
 
 
-class UiEvent(BaseModel):
+@dataclass(slots=True, frozen=True)
+class UiEvent:
     """Event to be sent to the UI thread."""
     kind: str
     task_id: uuid.UUID
     payload: str
 
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
-
 
-class StepResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class StepResult:
     """Result of a pipeline step."""
     success: bool
     output: str
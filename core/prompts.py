@@ -1,7 +1,84 @@
 """
 Prompt templates for the three-stage Claude debugging pipeline.
+
+Each prompt starts with a fixed system block that contains no paths,
+descriptions or attempt numbers, so it is byte-identical across tasks and
+retries and can be served from Claude's prompt cache. Everything dynamic
+is appended after it.
+"""
+
+_STEP1_SYSTEM = """[SYSTEM]
+You are an expert codebase investigator. First understand the repository
+structure and how the described issue might manifest. Be concise; produce a focused
+report and a proposed search plan. Do NOT modify any files in this step.
+
+Task: Understand the scope and narrow the search.
+
+Output:
+1) Likely impacted modules/packages
+2) How components interact with the bug/feature
+3) Shortlist of files/functions to inspect next
+"""
+
+_STEP2_SYSTEM = """[SYSTEM]
+You are a senior test engineer. Generate minimal failing tests that capture the intended
+behavior. Use pytest. Keep tests deterministic and small.
+
+- Use pytest; name files like test_bugfix_*.py.
+- Keep each file short and focused.
+- If project APIs are unclear, create minimal fakes/mocks.
+
+At the VERY END, print exactly one line:
+RESULT: TESTS_WRITTEN
+"""
+
+_STEP3_SYSTEM = """[SYSTEM]
+You are a surgical code fixer. Iterate: run tests, propose smallest change set, apply, re-run,
+until green or max attempts reached. Avoid irrelevant edits.
+You MUST execute all commands yourself.
+
+If failing:
+- Apply the smallest possible code changes
+- Re-run tests
+- Repeat until green or attempts exhausted
+
+At the ABSOLUTE END of your output, print exactly ONE line:
+RESULT: PASS
+or
+RESULT: FAIL
+"""
+
+_STEP1_TAIL = """
+Project root: {project_root}
+User description:
+{description}
+"""
+
+_STEP2_TAIL = """
+Using the analysis from: {step1_path}
+Write tests ONLY under: {tests_dir}
+"""
+
+_STEP3_FIELDS = """
+Analysis from step 1:
+<step1_report>
+{step1_report}
+</step1_report>
+
+Info about the tests made in step 2:
+<step2_report>
+{step2_report}
+</step2_report>
+
+Goal: Make tests in {tests_dir} pass.
+
+Run tests with:
+python -m pytest "{tests_dir}" -q
+
 """
 
+_STEP3_LIMIT = "You may make at most {max_attempts} fix attempts."
+
 
 def step1_prompt(project_root: str, description: str) -> str:
     """
@@ -14,21 +91,7 @@ def step1_prompt(project_root: str, description: str) -> str:
     Returns:
         Formatted prompt for Step 1
     """
-    return f"""[SYSTEM]
-You are an expert codebase investigator. First understand the repository
-structure and how the described issue might manifest. Be concise; produce a focused
-report and a proposed search plan. Do NOT modify any files in this step.
-
-Task: Understand the scope and narrow the search.
-Project root: {project_root}
-User description:
-{description}
-
-Output:
-1) Likely impacted modules/packages
-2) How components interact with the bug/feature
-3) Shortlist of files/functions to inspect next
-"""
+    return _STEP1_SYSTEM + _STEP1_TAIL.format(project_root=project_root, description=description)
 
 
 def step2_prompt(step1_path: str, tests_dir: str) -> str:
@@ -42,53 +105,30 @@ def step2_prompt(step1_path: str, tests_dir: str) -> str:
     Returns:
         Formatted prompt for Step 2
     """
-    return f"""[SYSTEM]
-You are a senior test engineer. Generate minimal failing tests that capture the intended
-behavior. Use pytest. Keep tests deterministic and small.
-
-Using the analysis from: {step1_path}
-Write tests ONLY under: {tests_dir}
-- Use pytest; name files like test_bugfix_*.py.
-- Keep each file short and focused.
-- If project APIs are unclear, create minimal fakes/mocks.
-
-At the VERY END, print exactly one line:
-RESULT: TESTS_WRITTEN"""
+    return _STEP2_SYSTEM + _STEP2_TAIL.format(step1_path=step1_path, tests_dir=tests_dir)
 
 
-def step3_prompt(tests_dir: str, step1_report_path: str, step2_report_path: str, attempt: int, max_attempts: int) -> str:
+def step3_prompt(tests_dir: str, step1_report: str, step2_report: str, max_attempts: int) -> str:
     """
     Generate Step 3 prompt for fixing and running tests.
 
+    Claude iterates on the fix itself within a single run, so the attempt
+    budget is part of the prompt rather than a loop in the caller. The
+    step 1 and step 2 reports are embedded so Claude doesn't have to read
+    them back from disk.
+
     Args:
         tests_dir: Directory containing tests to run
-        attempt: Current attempt number
-        max_attempts: Maximum number of attempts allowed
+        step1_report: Contents of the step 1 analysis
+        step2_report: Contents of the step 2 test report
+        max_attempts: Maximum number of fix attempts allowed
 
     Returns:
         Formatted prompt for Step 3
     """
-    return f"""[SYSTEM]
-                You are a surgical code fixer. Iterate: run tests, propose smallest change set, apply, re-run,
-                until green or max attempts reached. Avoid irrelevant edits.
-
-                see {step1_report_path} for the analysis.
-                see {step2_report_path} for the info about tests made.
-
-                Goal: Make tests in {tests_dir} pass.
-                You MUST execute all commands yourself.
-
-                Run tests with:
-                python -m pytest "{tests_dir}" -q
-
-                If failing:
-                - Apply the smallest possible code changes
-                - Re-run tests
-                - Repeat until green or attempts exhausted
-
-                At the ABSOLUTE END of your output, print exactly ONE line:
-                RESULT: PASS
-                or
-                RESULT: FAIL
-
-                Attempt {attempt} of {max_attempts}."""
\ No newline at end of file
+    fields = _STEP3_FIELDS.format(
+        tests_dir=tests_dir,
+        step1_report=step1_report.strip(),
+        step2_report=step2_report.strip(),
+    )
+    return _STEP3_SYSTEM + fields + _STEP3_LIMIT.format(max_attempts=max_attempts)
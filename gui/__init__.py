@@ -1,4 +1,11 @@
 """GUI package for Claude Debugger."""
-from .main_window import MainWindow
 
-__all__ = ["MainWindow"]
\ No newline at end of file
+__all__ = ["MainWindow"]
+
+
+def __getattr__(name):
+    # Import the window (and with it PySide6) only when it is first asked for
+    if name == "MainWindow":
+        from .main_window import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
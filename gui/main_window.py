@@ -4,18 +4,18 @@ Main PySide6 GUI window for the Fixit.
 import asyncio
 import logging
 import threading
+import time
+from collections import deque
 from pathlib import Path
-from queue import Queue, Empty
-from typing import Optional
+from types import SimpleNamespace
+from typing import Deque, Optional
 
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QGridLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QRadioButton,
-    QButtonGroup, QGroupBox, QFileDialog, QMessageBox, QSplitter, QFrame,
-    QScrollArea
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QTextEdit, QPlainTextEdit, QRadioButton, QButtonGroup,
+    QFileDialog, QMessageBox, QFrame
 )
-from PySide6.QtCore import QTimer, Qt, Signal, QObject
-from PySide6.QtGui import QFont, QPalette, QColor, QTextCursor
+from PySide6.QtCore import Qt, Signal, QObject
 
 from core.models import TaskItem, TaskType, UiEvent
 from core.manager import run_manager_in_thread
@@ -23,10 +23,226 @@ from core.manager import run_manager_in_thread
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on undrained UI events; the oldest are dropped past this
+UI_QUEUE_MAX = 4096
+
+# Upper bound on tasks submitted but not yet taken by the manager
+MANAGER_QUEUE_MAX = 64
+
+# Lines kept in the activity log; older lines are dropped as new ones arrive
+LOG_MAX_BLOCKS = 5000
+
+# OpenAI-inspired color palette
+COLORS = SimpleNamespace(
+    background='#fafafa',              # Very light grey background
+    surface='#ffffff',                 # White surface
+    surface_alt='#f7f7f8',             # Alternative surface
+    border='#e5e5e5',                  # Light border
+    border_hover='#d1d5db',            # Border hover
+    text_primary='#1f2937',            # Dark grey text
+    text_secondary='#6b7280',          # Medium grey text
+    text_muted='#9ca3af',              # Light grey text
+    accent='#10a37f',                  # OpenAI green
+    accent_hover='#0d8f6a',            # Darker green
+    danger='#ef4444',                  # Red for cancel
+    danger_hover='#dc2626',            # Darker red
+    input_bg='#ffffff',                # Input background
+    input_border='#d1d5db',            # Input border
+    sidebar='#f9fafb',                 # Sidebar background
+)
+
+# Window-wide stylesheet. Widgets opt in through their objectName; container
+# rules come first so the more specific widget rules after them win ties.
+_STYLESHEET_TEMPLATE = """
+    QMainWindow {{
+        background-color: {background};
+        color: {text_primary};
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
+    }}
+    #central, #central * {{
+        background-color: {background};
+    }}
+    QFrame#sidebar, #sidebar QFrame {{
+        background-color: {sidebar};
+        border-right: 1px solid {border};
+    }}
+    #logPanel, #logPanel * {{
+        background-color: {surface};
+    }}
+    QFrame#logContainer, #logContainer QFrame {{
+        background-color: {surface_alt};
+        border: 1px solid {border};
+        border-radius: 8px;
+    }}
+    QLabel#header {{
+        color: {text_primary};
+        font-size: 20px;
+        font-weight: 600;
+        margin-bottom: 8px;
+    }}
+    QLabel#subtitle {{
+        color: {text_secondary};
+        font-size: 14px;
+        margin-bottom: 16px;
+    }}
+    QLabel#projectRootLabel {{
+        color: {text_primary};
+        font-size: 14px;
+        font-weight: 500;
+        margin-bottom: 4px;
+    }}
+    QLabel#sectionLabel {{
+        color: {text_primary};
+        font-size: 14px;
+        font-weight: 500;
+    }}
+    QLineEdit#projectRoot {{
+        background-color: {input_bg};
+        border: 1px solid {input_border};
+        border-radius: 6px;
+        padding: 10px 12px;
+        font-size: 14px;
+        color: {text_primary};
+    }}
+    QLineEdit#projectRoot:focus {{
+        border-color: {accent};
+        outline: none;
+    }}
+    QPushButton#browseButton {{
+        background-color: {surface};
+        border: 1px solid {input_border};
+        border-radius: 6px;
+        padding: 10px 16px;
+        font-size: 14px;
+        font-weight: 500;
+        color: {text_primary};
+        min-width: 80px;
+    }}
+    QPushButton#browseButton:hover {{
+        background-color: {surface_alt};
+        border-color: {border_hover};
+    }}
+    QPushButton#browseButton:pressed {{
+        background-color: {border};
+    }}
+    QRadioButton#taskTypeRadio {{
+        color: {text_primary};
+        font-size: 14px;
+        spacing: 8px;
+    }}
+    QRadioButton#taskTypeRadio::indicator {{
+        width: 16px;
+        height: 16px;
+        border-radius: 8px;
+        border: 2px solid {input_border};
+        background-color: {surface};
+    }}
+    QRadioButton#taskTypeRadio::indicator:checked {{
+        border-color: {accent};
+        background-color: {accent};
+    }}
+    QRadioButton#taskTypeRadio::indicator:checked::after {{
+        content: '';
+        width: 6px;
+        height: 6px;
+        border-radius: 3px;
+        background-color: white;
+        margin: 3px;
+    }}
+    QTextEdit#description {{
+        background-color: {input_bg};
+        border: 1px solid {input_border};
+        border-radius: 6px;
+        padding: 12px;
+        font-size: 14px;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
+        color: {text_primary};
+        line-height: 1.4;
+    }}
+    QTextEdit#description:focus {{
+        border-color: {accent};
+        outline: none;
+    }}
+    QPushButton#primaryButton {{
+        background-color: {accent};
+        border: none;
+        border-radius: 6px;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: 600;
+        color: white;
+    }}
+    QPushButton#primaryButton:hover {{
+        background-color: {accent_hover};
+    }}
+    QPushButton#primaryButton:pressed {{
+        background-color: {accent_hover};
+        transform: translateY(1px);
+    }}
+    QPushButton#secondaryButton {{
+        background-color: transparent;
+        border: 1px solid {input_border};
+        border-radius: 6px;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: 500;
+        color: {text_secondary};
+    }}
+    QPushButton#secondaryButton:hover {{
+        background-color: {surface_alt};
+        border-color: {border_hover};
+        color: {text_primary};
+    }}
+    QLabel#logTitle {{
+        color: {text_primary};
+        font-size: 18px;
+        font-weight: 600;
+    }}
+    QPlainTextEdit#log {{
+        background-color: {surface_alt};
+        border: none;
+        border-radius: 7px;
+        padding: 16px;
+        font-family: 'SF Mono', 'Monaco', 'Consolas', 'Courier New', monospace;
+        font-size: 13px;
+        color: {text_primary};
+        line-height: 1.5;
+    }}
+    QPlainTextEdit#log QScrollBar:vertical {{
+        background-color: transparent;
+        width: 8px;
+        border-radius: 4px;
+    }}
+    QPlainTextEdit#log QScrollBar::handle:vertical {{
+        background-color: {border};
+        border-radius: 4px;
+        min-height: 20px;
+    }}
+    QPlainTextEdit#log QScrollBar::handle:vertical:hover {{
+        background-color: {border_hover};
+    }}
+"""
+
+STYLESHEET = _STYLESHEET_TEMPLATE.format_map(vars(COLORS))
+
+
+class UiSignals(QObject):
+    """Signals the manager thread emits to wake the GUI thread."""
+    events_ready = Signal()
+    # (error message, description of the rejected task)
+    task_rejected = Signal(str, str)
+
 
 class MainWindow(QMainWindow):
     """Main GUI window for the Fixit."""
 
+    __slots__ = (
+        "ui_queue", "ui_signals", "_ui_wake_pending",
+        "manager_queue", "manager_thread", "manager_loop",
+        "project_root_line_edit", "bug_radio", "feature_radio",
+        "task_type_group", "description_text", "log_text",
+    )
+
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
@@ -35,8 +251,14 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1400, 900)
         self.setMinimumSize(1200, 700)
 
-        # Queues for communication
-        self.ui_queue = Queue()
+        # Queues for communication; the manager emits events_ready after an
+        # append and Qt delivers it to the GUI thread as a queued call. The
+        # bounded deque discards the oldest event when a burst overfills it.
+        self.ui_queue: Deque[UiEvent] = deque(maxlen=UI_QUEUE_MAX)
+        self.ui_signals = UiSignals()
+        self.ui_signals.events_ready.connect(self._process_ui_events, Qt.QueuedConnection)
+        self.ui_signals.task_rejected.connect(self._on_task_rejected, Qt.QueuedConnection)
+        self._ui_wake_pending = False
         self.manager_queue: Optional[asyncio.Queue] = None
 
         # Manager thread
@@ -49,48 +271,22 @@ class MainWindow(QMainWindow):
         self.feature_radio: Optional[QRadioButton] = None
         self.task_type_group: Optional[QButtonGroup] = None
         self.description_text: Optional[QTextEdit] = None
-        self.log_text: Optional[QTextEdit] = None
+        self.log_text: Optional[QPlainTextEdit] = None
 
         self._setup_modern_theme()
         self._setup_gui()
         self._start_manager_thread()
-        self._start_ui_update_timer()
 
     def _setup_modern_theme(self):
         """Set up OpenAI-style modern theme with light grey colors."""
-        # OpenAI-inspired color palette
-        self.colors = {
-            'background': '#fafafa',           # Very light grey background
-            'surface': '#ffffff',             # White surface
-            'surface_alt': '#f7f7f8',         # Alternative surface
-            'border': '#e5e5e5',              # Light border
-            'border_hover': '#d1d5db',        # Border hover
-            'text_primary': '#1f2937',        # Dark grey text
-            'text_secondary': '#6b7280',      # Medium grey text
-            'text_muted': '#9ca3af',          # Light grey text
-            'accent': '#10a37f',              # OpenAI green
-            'accent_hover': '#0d8f6a',        # Darker green
-            'danger': '#ef4444',              # Red for cancel
-            'danger_hover': '#dc2626',        # Darker red
-            'input_bg': '#ffffff',            # Input background
-            'input_border': '#d1d5db',        # Input border
-            'sidebar': '#f9fafb',             # Sidebar background
-        }
-
-        # Set application-wide stylesheet
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {self.colors['background']};
-                color: {self.colors['text_primary']};
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
-            }}
-        """)
+        # One stylesheet for the whole window; widgets pick their rules by objectName
+        self.setStyleSheet(STYLESHEET)
 
     def _setup_gui(self):
         """Set up the modern GUI layout."""
         # Central widget with background
         central_widget = QWidget()
-        central_widget.setStyleSheet(f"background-color: {self.colors['background']};")
+        central_widget.setObjectName("central")
         self.setCentralWidget(central_widget)
 
         # Main layout without margins for full coverage
@@ -112,13 +308,8 @@ class MainWindow(QMainWindow):
         """Create the modern left configuration panel."""
         # Main container
         container = QFrame()
+        container.setObjectName("sidebar")
         container.setFixedWidth(380)
-        container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.colors['sidebar']};
-                border-right: 1px solid {self.colors['border']};
-            }}
-        """)
 
         layout = QVBoxLayout(container)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -126,38 +317,25 @@ class MainWindow(QMainWindow):
 
         # Header
         header = QLabel("Fixit")
-        header.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_primary']};
-                font-size: 20px;
-                font-weight: 600;
-                margin-bottom: 8px;
-            }}
-        """)
+        header.setObjectName("header")
         layout.addWidget(header)
 
         # Subtitle
         subtitle = QLabel("Automated debugging with Claude Code")
-        subtitle.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_secondary']};
-                font-size: 14px;
-                margin-bottom: 16px;
-            }}
-        """)
+        subtitle.setObjectName("subtitle")
         layout.addWidget(subtitle)
 
         # Project root section
-        layout.addWidget(self._create_project_section())
+        layout.addLayout(self._create_project_section())
 
         # Task type section
-        layout.addWidget(self._create_task_type_section())
+        layout.addLayout(self._create_task_type_section())
 
         # Description section
-        layout.addWidget(self._create_description_section())
+        layout.addLayout(self._create_description_section())
 
         # Action buttons
-        layout.addWidget(self._create_action_buttons())
+        layout.addLayout(self._create_action_buttons())
 
         # Spacer to push everything to top
         layout.addStretch()
@@ -166,98 +344,46 @@ class MainWindow(QMainWindow):
 
     def _create_project_section(self):
         """Create the project root selection section."""
-        section = QFrame()
-        layout = QVBoxLayout(section)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = QVBoxLayout()
         layout.setSpacing(8)
 
         # Label
         label = QLabel("Project Root")
-        label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_primary']};
-                font-size: 14px;
-                font-weight: 500;
-                margin-bottom: 4px;
-            }}
-        """)
+        label.setObjectName("projectRootLabel")
         layout.addWidget(label)
 
-        # Input container
-        input_container = QFrame()
-        input_layout = QHBoxLayout(input_container)
-        input_layout.setContentsMargins(0, 0, 0, 0)
+        # Input row
+        input_layout = QHBoxLayout()
         input_layout.setSpacing(8)
 
         # Path input
         self.project_root_line_edit = QLineEdit()
+        self.project_root_line_edit.setObjectName("projectRoot")
         self.project_root_line_edit.setPlaceholderText("Select project directory...")
-        self.project_root_line_edit.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {self.colors['input_bg']};
-                border: 1px solid {self.colors['input_border']};
-                border-radius: 6px;
-                padding: 10px 12px;
-                font-size: 14px;
-                color: {self.colors['text_primary']};
-            }}
-            QLineEdit:focus {{
-                border-color: {self.colors['accent']};
-                outline: none;
-            }}
-        """)
 
         # Browse button
         browse_button = QPushButton("Browse")
+        browse_button.setObjectName("browseButton")
         browse_button.clicked.connect(self._browse_project_root)
-        browse_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['input_border']};
-                border-radius: 6px;
-                padding: 10px 16px;
-                font-size: 14px;
-                font-weight: 500;
-                color: {self.colors['text_primary']};
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.colors['surface_alt']};
-                border-color: {self.colors['border_hover']};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.colors['border']};
-            }}
-        """)
 
         input_layout.addWidget(self.project_root_line_edit)
         input_layout.addWidget(browse_button)
-        layout.addWidget(input_container)
+        layout.addLayout(input_layout)
 
-        return section
+        return layout
 
     def _create_task_type_section(self):
         """Create the task type selection section."""
-        section = QFrame()
-        layout = QVBoxLayout(section)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = QVBoxLayout()
         layout.setSpacing(12)
 
         # Label
         label = QLabel("Task Type")
-        label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_primary']};
-                font-size: 14px;
-                font-weight: 500;
-            }}
-        """)
+        label.setObjectName("sectionLabel")
         layout.addWidget(label)
 
-        # Radio buttons container
-        radio_container = QFrame()
-        radio_layout = QHBoxLayout(radio_container)
-        radio_layout.setContentsMargins(0, 0, 0, 0)
+        # Radio buttons row
+        radio_layout = QHBoxLayout()
         radio_layout.setSpacing(16)
 
         # Radio buttons with modern styling
@@ -266,32 +392,7 @@ class MainWindow(QMainWindow):
         self.bug_radio.setChecked(True)
 
         for radio in [self.bug_radio, self.feature_radio]:
-            radio.setStyleSheet(f"""
-                QRadioButton {{
-                    color: {self.colors['text_primary']};
-                    font-size: 14px;
-                    spacing: 8px;
-                }}
-                QRadioButton::indicator {{
-                    width: 16px;
-                    height: 16px;
-                    border-radius: 8px;
-                    border: 2px solid {self.colors['input_border']};
-                    background-color: {self.colors['surface']};
-                }}
-                QRadioButton::indicator:checked {{
-                    border-color: {self.colors['accent']};
-                    background-color: {self.colors['accent']};
-                }}
-                QRadioButton::indicator:checked::after {{
-                    content: '';
-                    width: 6px;
-                    height: 6px;
-                    border-radius: 3px;
-                    background-color: white;
-                    margin: 3px;
-                }}
-            """)
+            radio.setObjectName("taskTypeRadio")
 
         self.task_type_group = QButtonGroup()
         self.task_type_group.addButton(self.bug_radio, 0)
@@ -301,110 +402,53 @@ class MainWindow(QMainWindow):
         radio_layout.addWidget(self.feature_radio)
         radio_layout.addStretch()
 
-        layout.addWidget(radio_container)
-        return section
+        layout.addLayout(radio_layout)
+        return layout
 
     def _create_description_section(self):
         """Create the description input section."""
-        section = QFrame()
-        layout = QVBoxLayout(section)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = QVBoxLayout()
         layout.setSpacing(8)
 
         # Label
         label = QLabel("Description")
-        label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_primary']};
-                font-size: 14px;
-                font-weight: 500;
-            }}
-        """)
+        label.setObjectName("sectionLabel")
         layout.addWidget(label)
 
         # Text area
         self.description_text = QTextEdit()
+        self.description_text.setObjectName("description")
         self.description_text.setPlaceholderText("Describe the bug or feature test you want Claude to work on...")
         self.description_text.setMinimumHeight(140)
         self.description_text.setMaximumHeight(200)
-        self.description_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {self.colors['input_bg']};
-                border: 1px solid {self.colors['input_border']};
-                border-radius: 6px;
-                padding: 12px;
-                font-size: 14px;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
-                color: {self.colors['text_primary']};
-                line-height: 1.4;
-            }}
-            QTextEdit:focus {{
-                border-color: {self.colors['accent']};
-                outline: none;
-            }}
-        """)
         layout.addWidget(self.description_text)
 
-        return section
+        return layout
 
     def _create_action_buttons(self):
         """Create the action buttons section."""
-        section = QFrame()
-        layout = QVBoxLayout(section)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = QVBoxLayout()
         layout.setSpacing(12)
 
         # Add Task button (primary)
         add_button = QPushButton("Start Debugging")
+        add_button.setObjectName("primaryButton")
         add_button.clicked.connect(self._add_task)
-        add_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.colors['accent']};
-                border: none;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: 600;
-                color: white;
-            }}
-            QPushButton:hover {{
-                background-color: {self.colors['accent_hover']};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.colors['accent_hover']};
-                transform: translateY(1px);
-            }}
-        """)
 
         # Cancel All button (secondary)
         cancel_button = QPushButton("Cancel All Tasks")
+        cancel_button.setObjectName("secondaryButton")
         cancel_button.clicked.connect(self._cancel_all)
-        cancel_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 1px solid {self.colors['input_border']};
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: 500;
-                color: {self.colors['text_secondary']};
-            }}
-            QPushButton:hover {{
-                background-color: {self.colors['surface_alt']};
-                border-color: {self.colors['border_hover']};
-                color: {self.colors['text_primary']};
-            }}
-        """)
 
         layout.addWidget(add_button)
         layout.addWidget(cancel_button)
 
-        return section
+        return layout
 
     def _create_right_panel(self):
         """Create the modern right log panel."""
         container = QFrame()
-        container.setStyleSheet(f"background-color: {self.colors['surface']};")
+        container.setObjectName("logPanel")
 
         layout = QVBoxLayout(container)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -415,13 +459,7 @@ class MainWindow(QMainWindow):
         header_layout.setContentsMargins(0, 0, 0, 0)
 
         title = QLabel("Activity Log")
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_primary']};
-                font-size: 18px;
-                font-weight: 600;
-            }}
-        """)
+        title.setObjectName("logTitle")
 
         header_layout.addWidget(title)
         header_layout.addStretch()
@@ -429,45 +467,17 @@ class MainWindow(QMainWindow):
 
         # Log container with modern styling
         log_container = QFrame()
-        log_container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-            }}
-        """)
+        log_container.setObjectName("logContainer")
 
         log_layout = QVBoxLayout(log_container)
         log_layout.setContentsMargins(1, 1, 1, 1)
 
         # Log text area
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
+        self.log_text.setObjectName("log")
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {self.colors['surface_alt']};
-                border: none;
-                border-radius: 7px;
-                padding: 16px;
-                font-family: 'SF Mono', 'Monaco', 'Consolas', 'Courier New', monospace;
-                font-size: 13px;
-                color: {self.colors['text_primary']};
-                line-height: 1.5;
-            }}
-            QScrollBar:vertical {{
-                background-color: transparent;
-                width: 8px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {self.colors['border']};
-                border-radius: 4px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {self.colors['border_hover']};
-            }}
-        """)
+        # Oldest lines are dropped once the cap is reached
+        self.log_text.setMaximumBlockCount(LOG_MAX_BLOCKS)
 
         # Add welcome message with better formatting
         welcome_msg = """Welcome to Fixit
@@ -477,7 +487,7 @@ class MainWindow(QMainWindow):
 🔧 Select a project and describe your issue to get started
 
 Waiting for your first task..."""
-        self.log_text.setText(welcome_msg)
+        self.log_text.setPlainText(welcome_msg)
 
         log_layout.addWidget(self.log_text)
         layout.addWidget(log_container)
@@ -506,14 +516,16 @@ Waiting for your first task..."""
             QMessageBox.critical(self, "Error", "Please select a project root directory.")
             return
 
-        if not Path(project_root).exists():
-            QMessageBox.critical(self, "Error", "Project root directory does not exist.")
-            return
-
         if not description:
             QMessageBox.critical(self, "Error", "Please provide a task description.")
             return
 
+        # Reading the size from this thread is only advisory; _submit_task
+        # handles the case where the queue fills up before the put runs
+        if self.manager_queue.full():
+            QMessageBox.warning(self, "Busy", "Queue full — please wait for running tasks to finish.")
+            return
+
         # Create task item
         task = TaskItem(
             project_root=Path(project_root),
@@ -524,20 +536,39 @@ Waiting for your first task..."""
         # Send to manager
         if self.manager_loop and self.manager_queue:
             try:
-                future = asyncio.run_coroutine_threadsafe(
-                    self.manager_queue.put(task),
-                    self.manager_loop
-                )
-                future.result(timeout=1.0)
+                # Validate and enqueue on the manager loop and return at once;
+                # the manager logs an "enqueued" event when it picks the task up
+                asyncio.run_coroutine_threadsafe(self._submit_task(task), self.manager_loop)
 
-                # Clear description after successful submission
+                # _on_task_rejected puts the description back if validation fails
                 self.description_text.clear()
-                self._log_message(f"Task added: {task.id.hex[:8]}")
+                self._log_message(f"Task submitted: {task.id.hex[:8]}")
 
-            except Exception as e:
+            except RuntimeError as e:
                 logger.error(f"Failed to add task: {e}")
                 QMessageBox.critical(self, "Error", f"Failed to add task: {str(e)}")
 
+    async def _submit_task(self, task: TaskItem):
+        """Check a task's project root and put it on the manager queue (manager thread)."""
+        # The stat can stall on network drives, so it stays off the GUI thread
+        if not await asyncio.to_thread(task.project_root.exists):
+            self.ui_signals.task_rejected.emit("Project root directory does not exist.", task.description)
+            return
+
+        try:
+            self.manager_queue.put_nowait(task)
+        except asyncio.QueueFull:
+            self.ui_signals.task_rejected.emit(
+                "Queue full — please wait for running tasks to finish.", task.description
+            )
+
+    def _on_task_rejected(self, message: str, description: str):
+        """Report a task the manager side refused and give its description back."""
+        self._log_message(f"Task rejected: {message}")
+        QMessageBox.critical(self, "Error", message)
+        if not self.description_text.toPlainText().strip():
+            self.description_text.setPlainText(description)
+
     def _cancel_all(self):
         """Cancel all pending tasks."""
         # For now, just log the action
@@ -547,37 +578,27 @@ Waiting for your first task..."""
 
     def _log_message(self, message: str):
         """Add a formatted message to the log feed."""
-        import datetime
-
         # Get current time
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-
-        # Format message with timestamp and modern styling
-        formatted_message = f"[{timestamp}] {message}"
-
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
+        timestamp = time.strftime("%H:%M:%S")
 
-        # If not the first message, add a newline
-        if cursor.position() > 0:
-            cursor.insertText("\n")
-
-        cursor.insertText(formatted_message)
-        self.log_text.setTextCursor(cursor)
-        self.log_text.ensureCursorVisible()
+        # Append as a new block; the view follows the tail when scrolled to the bottom
+        self.log_text.appendPlainText(f"[{timestamp}] {message}")
 
     def _start_manager_thread(self):
         """Start the background manager thread."""
+        # Create the loop and queue up front so _add_task never sees them unset
+        # while the thread is still starting; asyncio.Queue binds to the loop
+        # on first use, which happens in the manager thread.
+        self.manager_loop = asyncio.new_event_loop()
+        self.manager_queue = asyncio.Queue(maxsize=MANAGER_QUEUE_MAX)
+
         def run_manager():
             """Run the manager in a separate thread with its own event loop."""
-            self.manager_loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.manager_loop)
 
-            self.manager_queue = asyncio.Queue()
-
             try:
                 self.manager_loop.run_until_complete(
-                    run_manager_in_thread(self.ui_queue, self.manager_queue)
+                    run_manager_in_thread(self.ui_queue, self.manager_queue, self._request_ui_update)
                 )
             except Exception as e:
                 logger.error(f"Manager thread error: {e}")
@@ -587,26 +608,49 @@ Waiting for your first task..."""
         self.manager_thread = threading.Thread(target=run_manager, daemon=True)
         self.manager_thread.start()
 
-    def _start_ui_update_timer(self):
-        """Start the timer to update UI from the queue."""
-        self.ui_timer = QTimer()
-        self.ui_timer.timeout.connect(self._process_ui_events)
-        self.ui_timer.start(150)  # 150ms interval
+    def _request_ui_update(self):
+        """Wake the GUI thread unless a wakeup is already on its way (manager thread)."""
+        if not self._ui_wake_pending:
+            self._ui_wake_pending = True
+            self.ui_signals.events_ready.emit()
 
     def _process_ui_events(self):
-        """Process pending UI events from the queue."""
+        """Process pending UI events from the queue as a single log update."""
+        # Clear before draining so an append racing the drain emits a fresh wakeup
+        self._ui_wake_pending = False
+
+        # Identical consecutive payloads collapse into one "(×N)" line
+        lines = []
+        last = None
+        repeats = 0
         try:
             while True:
-                event: UiEvent = self.ui_queue.get_nowait()
-                self._log_message(event.payload)
-        except Empty:
+                payload = self.ui_queue.popleft().payload
+                if payload == last:
+                    repeats += 1
+                    continue
+                if repeats:
+                    lines[-1] += f" (×{repeats + 1})"
+                lines.append(payload)
+                last = payload
+                repeats = 0
+        except IndexError:
             pass
 
+        if not lines:
+            return
+        if repeats:
+            lines[-1] += f" (×{repeats + 1})"
+
+        # One timestamp and one insert per batch instead of one per event
+        prefix = f"[{time.strftime('%H:%M:%S')}] "
+        text = "\n".join(prefix + line for line in lines)
+
+        self.log_text.appendPlainText(text)
+
     def closeEvent(self, event):
         """Handle window close event."""
         # Cleanup
-        if hasattr(self, 'ui_timer'):
-            self.ui_timer.stop()
         if self.manager_loop:
             self.manager_loop.call_soon_threadsafe(self.manager_loop.stop)
         if self.manager_thread:
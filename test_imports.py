@@ -1,44 +1,90 @@
 """
 Test script to verify all imports work correctly.
 """
+import importlib
+import importlib.util
 import sys
+from importlib.machinery import ModuleSpec
 from pathlib import Path
+from typing import Dict, List, Optional
 
-def test_imports():
+# Modules that must be importable; they are located but not executed
+MODULES: List[str] = [
+    "core", "core.models", "core.prompts", "core.cli_strings",
+    "claude", "claude.client",
+    "gui", "gui.main_window",
+]
+
+# Names each package re-exports
+EXPORTS: Dict[str, List[str]] = {
+    "core": ["TaskItem", "TaskType", "TaskStatus", "UiEvent",
+             "step1_prompt", "step2_prompt", "step3_prompt",
+             "STEP2_SENTINEL", "PASS_SENTINEL", "FAIL_SENTINEL"],
+    "claude": ["ClaudeClient", "ClaudeCLIError"],
+}
+
+# find_spec results, kept across calls; the tree doesn't change during a run
+_SPEC_CACHE: Dict[str, Optional[ModuleSpec]] = {}
+
+def _spec(name: str) -> Optional[ModuleSpec]:
+    """Return the cached spec for a module, looking it up on first use."""
+    if name in _SPEC_CACHE:
+        return _SPEC_CACHE[name]
+
+    # find_spec raises for a submodule whose package is missing, so resolve
+    # the parent first and turn that case into a plain None
+    parent = name.rpartition(".")[0]
+    if parent and _spec(parent) is None:
+        spec = None
+    else:
+        spec = importlib.util.find_spec(name)
+    _SPEC_CACHE[name] = spec
+    return spec
+
+def test_imports() -> bool:
     """Test that all modules can be imported without errors."""
     try:
         print("Testing imports...")
 
-        # Test core imports
-        from core import TaskItem, TaskType, TaskStatus, UiEvent
-        print("OK Core models imported successfully")
-
-        from core import step1_prompt, step2_prompt, step3_prompt
-        print("OK Core prompts imported successfully")
+        # find_spec locates a module without running it; for a submodule it
+        # imports the parent package only, so gui.main_window (and PySide6)
+        # is never loaded here
+        missing = [name for name in MODULES if _spec(name) is None]
+        if missing:
+            print(f"ERROR Modules not found: {missing}")
+            return False
+        print("OK All modules located")
 
-        from core import STEP2_SENTINEL, PASS_SENTINEL, FAIL_SENTINEL
-        print("OK Core constants imported successfully")
+        # The GUI needs PySide6; a spec lookup checks for it without loading Qt
+        if _spec("PySide6") is None:
+            print("WARNING PySide6 not installed; the GUI will not start")
+        else:
+            print("OK PySide6 available for the GUI")
 
-        # Test Claude client
-        from claude import ClaudeClient, ClaudeCLIError
-        print("OK Claude client imported successfully")
+        # The packages are already imported by find_spec, so checking their
+        # re-exports costs nothing extra
+        for package, names in EXPORTS.items():
+            absent = [name for name in names if not hasattr(sys.modules[package], name)]
+            if absent:
+                print(f"ERROR {package} is missing exports: {absent}")
+                return False
+            print(f"OK {package} exports present")
 
-        # Test GUI (this might fail without tkinter but let's try)
-        try:
-            from gui import MainWindow
-            print("OK GUI imported successfully")
-        except ImportError as e:
-            print(f"WARNING GUI import failed (expected if tkinter not available): {e}")
+        # Only the modules exercised below are imported directly, plus the
+        # manager, which no package __init__ loads; none of them needs Qt
+        models = importlib.import_module("core.models")
+        prompts = importlib.import_module("core.prompts")
+        importlib.import_module("core.manager")
 
         # Test basic functionality
-        task = TaskItem(
+        task = models.TaskItem(
             project_root=Path("."),
-            task_type=TaskType.BUG,
+            task_type=models.TaskType.BUG,
             description="Test task"
         )
         print(f"OK Created test task: {task.id.hex[:8]}")
 
-        prompt = step1_prompt("/test/path", "Test description")
+        prompt = prompts.step1_prompt("/test/path", "Test description")
         print(f"OK Generated step1 prompt (length: {len(prompt)})")
 
         print("\nAll imports successful!")
@@ -50,4 +96,4 @@ def test_imports():
 
 if __name__ == "__main__":
     success = test_imports()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -1,90 +1,168 @@
 """
 Simple test to verify project structure without external dependencies.
 """
+import functools
 import os
-from pathlib import Path
-
-def test_structure():
-    """Test that all required files exist."""
-    print("Testing project structure...")
-
-    required_files = [
-        "app.py",
-        "core/__init__.py",
-        "core/models.py",
-        "core/manager.py",
-        "core/prompts.py",
-        "core/cli_strings.py",
-        "claude/__init__.py",
-        "claude/client.py",
-        "gui/__init__.py",
-        "gui/main_window.py",
-        "pyproject.toml",
-        ".gitignore"
-    ]
-
-    missing_files = []
-
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
-        else:
-            print(f"OK Found {file_path}")
-
-    if missing_files:
-        print(f"\nERROR Missing files: {missing_files}")
-        return False
-
-    print("\nAll required files present!")
-
-    # Test directory structure
-    required_dirs = ["core", "claude", "gui"]
-    for dir_name in required_dirs:
-        if not Path(dir_name).is_dir():
-            print(f"ERROR Missing directory: {dir_name}")
-            return False
-        else:
-            print(f"OK Directory {dir_name} exists")
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterator, List, Pattern, Set, Tuple
 
-    print("\nProject structure is complete!")
-    return True
+# Normalized once at import so they compare equal to the walk's native paths
+_REQUIRED_FILES: Tuple[str, ...] = tuple(os.path.normpath(p) for p in (
+    "app.py",
+    "core/__init__.py",
+    "core/models.py",
+    "core/manager.py",
+    "core/prompts.py",
+    "core/cli_strings.py",
+    "claude/__init__.py",
+    "claude/client.py",
+    "gui/__init__.py",
+    "gui/main_window.py",
+    "pyproject.toml",
+    ".gitignore",
+))
 
-def test_file_contents():
-    """Test that key files have expected content."""
-    print("\nTesting file contents...")
+# A tuple rather than a frozenset so the report order stays fixed
+_REQUIRED_DIRS: Tuple[str, ...] = ("core", "claude", "gui")
 
-    # Test pyproject.toml has correct name
-    pyproject_content = Path("pyproject.toml").read_text()
-    if 'name = "claude-debugger"' in pyproject_content:
-        print("OK pyproject.toml has correct project name")
-    else:
-        print("ERROR pyproject.toml missing correct project name")
-        return False
+# Byte markers each file must contain, with the report line for each outcome
+_MARKERS: Dict[str, Tuple[Tuple[bytes, str, str], ...]] = {
+    "pyproject.toml": (
+        (b'name = "claude-debugger"', "pyproject.toml has correct project name",
+         "pyproject.toml missing correct project name"),
+    ),
+    "app.py": (
+        (b"def main():", "app.py has main function", "app.py missing main function"),
+    ),
+    "core/models.py": (
+        (b"class TaskItem", "core/models.py has TaskItem class", "core/models.py missing TaskItem class"),
+        (b"class TaskType", "core/models.py has TaskType class", "core/models.py missing TaskType class"),
+    ),
+}
 
-    # Test app.py has main function
-    app_content = Path("app.py").read_text()
-    if "def main():" in app_content:
-        print("OK app.py has main function")
-    else:
-        print("ERROR app.py missing main function")
-        return False
+# Native (walk) path of each marker file -> its _MARKERS key
+_MARKER_FILES: Dict[str, str] = {os.path.normpath(path): path for path in _MARKERS}
 
-    # Test core modules have expected classes/functions
-    models_content = Path("core/models.py").read_text()
-    if "class TaskItem" in models_content:
-        print("OK core/models.py has TaskItem class")
-    else:
-        print("ERROR core/models.py missing TaskItem class")
-        return False
+# One alternation per file so all of its markers are found in a single pass
+_MARKER_PATTERNS: Dict[str, Pattern[bytes]] = {
+    path: re.compile(b"|".join(re.escape(marker) for marker, _, _ in markers))
+    for path, markers in _MARKERS.items()
+}
 
-    print("\nFile contents look good!")
-    return True
+def _parents(path: str) -> Iterator[str]:
+    """Yield every ancestor directory of a relative path, nearest first."""
+    parent = os.path.dirname(path)
+    while parent:
+        yield parent
+        parent = os.path.dirname(parent)
 
-if __name__ == "__main__":
-    structure_ok = test_structure()
-    contents_ok = test_file_contents()
+# Directories the structure walk has to enter: those holding required files
+_DESCEND_DIRS: FrozenSet[str] = frozenset(d for f in _REQUIRED_FILES for d in _parents(f))
+
+@functools.lru_cache(maxsize=None)
+def _read(path: str) -> bytes:
+    """Read a file once per process; markers are ASCII, so no decoding is needed."""
+    with open(path, "rb") as f:
+        return f.read()
+
+# Listings of one tree level run concurrently; on network mounts the
+# readdir round-trips then overlap instead of adding up
+_WALK_WORKERS = 8
+
+def _list_dir(root: str) -> List[Tuple[str, bool]]:
+    """Return (relative path, is_dir) for every entry directly under root."""
+    with os.scandir(root) as it:
+        return [
+            (entry.name if root == "." else os.path.join(root, entry.name),
+             entry.is_dir(follow_symlinks=False))
+            for entry in it
+        ]
+
+def _walk(root: str, descend: FrozenSet[str]) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield (relative path, is_dir) for entries under root, one level at a time.
+
+    Only directories named in descend are recursed into; a directory that
+    doesn't exist is never listed, so nothing below it costs a syscall.
+    DirEntry type information comes from the listing, not an extra stat().
+    """
+    level = [root]
+    with ThreadPoolExecutor(max_workers=_WALK_WORKERS) as pool:
+        while level:
+            # A single directory is listed inline; the pool only pays off for siblings
+            listings = [_list_dir(level[0])] if len(level) == 1 else pool.map(_list_dir, level)
+            next_level = []
+            for listing in listings:
+                for rel, is_dir in listing:
+                    yield rel, is_dir
+                    if is_dir and rel in descend:
+                        next_level.append(rel)
+            level = next_level
+
+def test_all() -> bool:
+    """Test that all required files exist and key files have expected content."""
+    # Collect the report and write it once instead of one print per line
+    out: List[str] = ["Testing project structure..."]
+    try:
+        # One recursive listing pass instead of one stat() per file; only the
+        # directories that hold required files (and their ancestors) are
+        # entered. Files with markers are read as soon as the listing shows
+        # them, so no path is looked up a second time.
+        found: Set[str] = set()
+        subdirs: Set[str] = set()
+        contents: Dict[str, bytes] = {}
+        for rel, is_dir in _walk(".", _DESCEND_DIRS):
+            found.add(rel)
+            if is_dir:
+                subdirs.add(rel)
+            elif rel in _MARKER_FILES:
+                contents[_MARKER_FILES[rel]] = _read(rel)
 
-    if structure_ok and contents_ok:
+        missing_files: List[str] = []
+
+        for file_path in _REQUIRED_FILES:
+            if file_path not in found:
+                missing_files.append(file_path)
+            else:
+                out.append(f"OK Found {file_path}")
+
+        if missing_files:
+            out.append(f"\nERROR Missing files: {missing_files}")
+            return False
+
+        out.append("\nAll required files present!")
+
+        # Test directory structure
+        for dir_name in _REQUIRED_DIRS:
+            if dir_name not in subdirs:
+                out.append(f"ERROR Missing directory: {dir_name}")
+                return False
+            else:
+                out.append(f"OK Directory {dir_name} exists")
+
+        out.append("\nProject structure is complete!")
+
+        # Every marker file is a required file, so its bytes were read above;
+        # each one is scanned once for all of its markers
+        out.append("\nTesting file contents...")
+        for path, markers in _MARKERS.items():
+            seen = set(_MARKER_PATTERNS[path].findall(contents[path]))
+            for marker, ok_msg, error_msg in markers:
+                if marker in seen:
+                    out.append(f"OK {ok_msg}")
+                else:
+                    out.append(f"ERROR {error_msg}")
+                    return False
+
+        out.append("\nFile contents look good!")
+        return True
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
+if __name__ == "__main__":
+    if test_all():
         print("\nSUCCESS: Project structure and contents are valid!")
         exit(0)
     else: